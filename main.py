@@ -1,13 +1,24 @@
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 import sqlite3
 import sys
+import threading
 import tkinter as tk
+from bisect import bisect_right
+from collections import OrderedDict
 from datetime import datetime
-from tkinter import messagebox
+from tkinter import font as tkfont
 
-import requests
-from PIL import Image, ImageTk, ImageDraw, ImageFont
+from PIL import Image, ImageTk
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # --- 1. Path & Display Configuration ---
 if "DISPLAY" not in os.environ:
@@ -18,13 +29,33 @@ if getattr(sys, 'frozen', False):
 else:
     application_path = os.path.dirname(os.path.abspath(__file__))
 
+SCREEN_SIZE = (800, 480)
+FORECAST_BOX_X = (10, 168, 326, 484, 642)
+FORECAST_BOX_W = 152
+# Backgrounds are soft gradients; bilinear is indistinguishable from Lanczos here and much cheaper
+RESAMPLE_FILTER = Image.Resampling.BILINEAR
+BG_CACHE_SIZE = 4
+# (connect, read) seconds; a short connect timeout fails fast when the Wi-Fi is down
+HTTP_TIMEOUT = (3, 10)
+# 8 px every 140 ms scrolls at the original 2 px / 35 ms speed with a quarter of the wakeups
+ALERT_STEP_PX = 8
+ALERT_TICK_MS = 140
+
 # --- 2. Logging Setup ---
 log_path = os.path.join(application_path, "weather_debug.log")
+# Records are queued on the calling thread and written to disk by a listener thread,
+# so SD card writes never stall the Tk loop; rotation keeps the log bounded.
+_log_file = logging.handlers.RotatingFileHandler(log_path, maxBytes=256_000, backupCount=2)
+_log_file.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_file)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+# The queue handler passes the bare message through; _log_file's formatter adds the prefix
 logging.basicConfig(
-    filename=log_path,
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    filemode='w'
+    level=logging.INFO,
+    format='%(message)s',
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 
 
@@ -38,40 +69,51 @@ DB_DIR = os.path.join(application_path, "settings")
 DB_PATH = os.path.join(DB_DIR, "settings.db")
 
 
+# A single long-lived connection; all reads are served from the in-memory copy
+_DB = None
+_DB_LOCK = threading.Lock()
+_SETTINGS = {}
+_PUT_SQL = "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)"
+
+
 def init_db():
+    global _DB
     try:
         os.makedirs(DB_DIR, exist_ok=True)
-        conn = sqlite3.connect(DB_PATH)
-        conn.execute('CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT)')
-        conn.commit()
-        conn.close()
+        _DB = sqlite3.connect(DB_PATH, check_same_thread=False)
+        atexit.register(_DB.close)
+        _DB.execute("PRAGMA journal_mode=WAL")
+        _DB.execute("PRAGMA synchronous=NORMAL")
+        _DB.execute("PRAGMA temp_store=MEMORY")
+        _DB.execute('CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT)')
+        _DB.commit()
+        _SETTINGS.update(_DB.execute("SELECT key, value FROM settings").fetchall())
         logging.info("Database initialized successfully.")
     except Exception as e:
         logging.error(f"DB Init Error: {e}")
 
 
 def get_setting(key):
-    try:
-        conn = sqlite3.connect(DB_PATH)
-        res = conn.execute("SELECT value FROM settings WHERE key=?", (key,)).fetchone()
-        conn.close()
-        return res[0] if res else None
-    except Exception as e:
-        logging.error(f"DB Read Error: {e}")
-        return None
+    return _SETTINGS.get(key)
 
 
-def save_setting(key, value):
+def save_settings(values):
+    # All rows go in one transaction so a config save costs a single commit
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.execute("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, value))
-        conn.commit()
-        conn.close()
-        logging.info(f"Setting saved: {key}")
+        with _DB_LOCK, _DB:
+            _DB.executemany(_PUT_SQL, values.items())
+        _SETTINGS.update(values)
+        logging.info(f"Settings saved: {', '.join(values)}")
     except Exception as e:
         logging.error(f"DB Write Error: {e}")
 
 
+@functools.lru_cache(maxsize=16)
+def format_day(ts):
+    # Daily forecast timestamps are fixed per day, so each label is only formatted once
+    return datetime.fromtimestamp(ts).strftime("%a %m/%d").upper()
+
+
 # --- 4. Main Application ---
 class WeatherApp(tk.Tk):
     def __init__(self) -> None:
@@ -83,39 +125,114 @@ class WeatherApp(tk.Tk):
         self.api_key = get_setting("api_key")
         self.lat = get_setting("lat")
         self.lon = get_setting("lon")
-        self.city = get_setting("city_name"),
-        self.state = get_setting("state_abbr"),
-        self.bg_image_ref = None
+        self.city = get_setting("city_name")
+        # Not "self.state": that would shadow tk.Tk.state()
+        self.state_abbr = get_setting("state_abbr")
+        self.bg_photo = None
         self.alert_text = None
         self.alert_canvas = None
+        self.alert_width = 0
+        self.alert_value = None
+        self._scroll_job = None
+        self._alert_scrolling = False
+        self._visible = True
+        self.setup_dialog = None
+        self.setup_key = None
+        self.setup_zip = None
+        self.setup_debug = None
         self.top_bar = None
         self.tooltip = None
-        self.bg_label = None
+        self.main_canvas = None
+        self.bg_item = None
+        self.city_item = None
+        self.temp_item = None
+        self.desc_item = None
+        self.date_item = None
+        self.icon_item = None
+        self.detail_items = []
+        self.forecast_items = []
+        self.icon_cache: dict[tuple[str, str], ImageTk.PhotoImage | None] = {}
+        self._last_icon = None
+        self._last_view = None
+        self._item_options = {}
+        self._last_forecast = [None] * len(FORECAST_BOX_X)
+        self._update_job = None
+        self._fetch_inflight = False
+        self._refetch_pending = False
+        self._retry_delay = 0
+        self.glass_overlay = None
+        self.bg_cache: OrderedDict[str, Image.Image] = OrderedDict()
+        self.available_icons = self.scan_images()
         self.forecast_details = []
+        self._last_tooltip_idx = None
+        self.fonts = self.load_fonts()
+
+        # Created on first use by get_http() so importing requests doesn't delay the first frame
+        self.http = None
+        self._http_lock = threading.Lock()
 
         self.geometry("800x480+0+0")
         self.attributes("-fullscreen", True)
         self.overrideredirect(True)
         self.configure(bg="black")
 
+        self.protocol("WM_DELETE_WINDOW", self.exit_app)
+        self.bind("<Map>", self.on_map_change)
+        self.bind("<Unmap>", self.on_map_change)
         self.setup_ui()
+        self.after_idle(self.preload_icons)
 
         if not all([self.api_key, self.lat, self.lon]):
             self.after(1000, self.show_setup_dialog)
         else:
             self.after(500, self.update_weather)
 
-        self.after(2000, self.scroll_alerts)
+    @staticmethod
+    def load_fonts():
+        # Negative sizes are pixels, matching the layout the dashboard was designed at
+        return {
+            "city": tkfont.Font(family="Arial", size=-32),
+            "temp": tkfont.Font(family="Arial", size=-100, weight="bold"),
+            "desc": tkfont.Font(family="Arial", size=-18),
+            "det": tkfont.Font(family="Arial", size=-18, weight="bold"),
+            "day": tkfont.Font(family="Arial", size=-12, weight="bold"),
+            "f_t": tkfont.Font(family="Arial", size=-14, weight="bold"),
+            "f_mm": tkfont.Font(family="Arial", size=-10),
+            "hum": tkfont.Font(family="Arial", size=-10),
+        }
+
+    @staticmethod
+    def build_glass_overlay():
+        from PIL import ImageDraw
+
+        overlay = Image.new("RGBA", SCREEN_SIZE, (0, 0, 0, 0))
+        draw_ov = ImageDraw.Draw(overlay)
+        glass_color = (0, 0, 0, 60)
+
+        draw_ov.rectangle([10, 45, 485, 290], fill=glass_color, outline=(255, 255, 255, 30), width=1)
+        draw_ov.rectangle([520, 45, 790, 275], fill=glass_color, outline=(255, 255, 255, 30), width=1)
+        for x_box in FORECAST_BOX_X:
+            draw_ov.rectangle([x_box, 305, x_box + FORECAST_BOX_W, 442], fill=glass_color,
+                              outline=(255, 255, 255, 40), width=1)
+            # Darker sub-box for the detailed text area
+            draw_ov.rectangle([x_box + 3, 355, x_box + 149, 435], fill=(0, 0, 0, 175),
+                              outline=(255, 255, 255, 20), width=1)
+        return overlay
 
     def setup_ui(self):
         logging.debug("Configuring UI layers...")
-        self.bg_label = tk.Label(self, bg="black")
-        self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+        # The glass panels never change, so render them once and bake them into each background
+        self.glass_overlay = self.build_glass_overlay()
+
+        self.main_canvas = tk.Canvas(self, width=SCREEN_SIZE[0], height=SCREEN_SIZE[1], bg="black",
+                                     highlightthickness=0)
+        self.main_canvas.place(x=0, y=0, relwidth=1, relheight=1)
+        self.build_canvas_items()
 
         self.tooltip = tk.Label(self, text="", font=("Arial", 10), bg="#222", fg="white",
                                 relief="solid", bd=1, padx=8, pady=5)
         self.tooltip.place_forget()
-        self.bg_label.bind("<Motion>", self.check_hover)
+        self.main_canvas.bind("<Motion>", self.check_hover)
 
         self.top_bar = tk.Frame(self, bg="#111", height=35)
         self.top_bar.place(x=0, y=0, width=800)
@@ -124,135 +241,259 @@ class WeatherApp(tk.Tk):
 
         self.alert_canvas = tk.Canvas(self, height=30, bg="darkred", highlightthickness=0)
         self.alert_canvas.place(x=0, y=450, width=800)
-        self.alert_text = self.alert_canvas.create_text(800, 15, text="Ready...", fill="white",
+        self.alert_text = self.alert_canvas.create_text(800, 15, text="", fill="white",
                                                         font=("Arial", 10, "bold"), anchor="w")
+        self.set_alert_text("Ready...")
+
+    def build_canvas_items(self):
+        # Text and icons live as canvas items on top of the background so a refresh only
+        # touches the items that changed instead of re-rendering and re-uploading the frame.
+        c, fonts = self.main_canvas, self.fonts
+        self.bg_item = c.create_image(0, 0, anchor="nw")
+        self.city_item = c.create_text(30, 60, font=fonts["city"], fill="#FFFFFF", anchor="nw")
+        self.temp_item = c.create_text(25, 95, font=fonts["temp"], fill="#FFFFFF", anchor="nw")
+        self.desc_item = c.create_text(30, 215, font=fonts["desc"], fill="#FFFFFF", anchor="nw")
+        self.date_item = c.create_text(30, 240, font=fonts["det"], fill="#FFFFFF", anchor="nw")
+        self.icon_item = c.create_image(180, 100, anchor="nw")
+        self.detail_items = [c.create_text(545, 65 + (i * 26), font=fonts["det"], fill="white", anchor="nw")
+                             for i in range(8)]
+
+        self.forecast_items = []
+        for i, x_box in enumerate(FORECAST_BOX_X):
+            x, tag = x_box + 15, f"forecast{i}"
+            self.forecast_items.append({
+                "day": c.create_text(x + 5, 312, font=fonts["day"], fill="#FFFFFF", anchor="nw", tags=tag),
+                "icon": c.create_image(x + 45, 280, anchor="nw", tags=tag),
+                "temp": c.create_text(x + 5, 360, font=fonts["f_t"], fill="#FFFFFF", anchor="nw", tags=tag),
+                "min_max": c.create_text(x + 5, 375, font=fonts["f_mm"], fill="#FFFFFF", anchor="nw", tags=tag),
+                "hum": c.create_text(x + 5, 390, font=fonts["hum"], fill="#48ff00", anchor="nw", tags=tag),
+                "sunrise": c.create_text(x + 5, 405, font=fonts["f_mm"], fill="#FFFFFF", anchor="nw", tags=tag),
+                "sunset": c.create_text(x + 5, 420, font=fonts["f_mm"], fill="#FFFFFF", anchor="nw", tags=tag),
+            })
 
     def check_hover(self, event):
+        idx = None
         if 305 <= event.y <= 442 and self.forecast_details:
-            idx = (event.x - 10) // 158
-            if 0 <= idx < len(self.forecast_details):
-                self.tooltip.config(text=self.forecast_details[idx])
-                self.tooltip.place(x=event.x, y=event.y - 80)
-                return
-        self.tooltip.place_forget()
+            idx = bisect_right(FORECAST_BOX_X, event.x) - 1
+            if not 0 <= idx < len(self.forecast_details) or event.x > FORECAST_BOX_X[idx] + FORECAST_BOX_W:
+                idx = None
+
+        # <Motion> fires per pixel; only touch the tooltip when the hovered box changes
+        if idx == self._last_tooltip_idx:
+            return
+        self._last_tooltip_idx = idx
+        if idx is None:
+            self.tooltip.place_forget()
+        else:
+            self.tooltip.config(text=self.forecast_details[idx])
+            self.tooltip.place(x=event.x, y=event.y - 80)
+
+    @staticmethod
+    def scan_images():
+        # One directory listing at startup replaces a stat() per image lookup
+        img_dir = os.path.join(application_path, "images")
+        try:
+            return {name: os.path.join(img_dir, name) for name in os.listdir(img_dir)}
+        except OSError as e:
+            logging.error(f"Image folder error: {e}")
+            return {}
+
+    def get_background(self, icon_code):
+        base = self.bg_cache.get(icon_code)
+        if base is not None:
+            self.bg_cache.move_to_end(icon_code)
+        else:
+            bg_file = self.available_icons.get(f"{icon_code}_bg.png") or self.available_icons.get("01d_bg.png")
+
+            # The backgrounds are opaque, so keep them RGB and blend the glass panels in through their alpha
+            base = Image.open(bg_file, formats=("PNG",)).convert("RGB")
+            if base.size != SCREEN_SIZE:
+                base = base.resize(SCREEN_SIZE, RESAMPLE_FILTER)
+            base.paste(self.glass_overlay, (0, 0), self.glass_overlay)
+            self.bg_cache[icon_code] = base
+            # Each entry is a full 800x480 frame; keep only the most recently shown conditions
+            if len(self.bg_cache) > BG_CACHE_SIZE:
+                self.bg_cache.popitem(last=False)
+            logging.debug(f"Background cached for {icon_code}")
+        return base
+
+    def preload_icons(self):
+        # PNG decoding runs on a worker; only the PhotoImage upload has to happen on the Tk thread
+        threading.Thread(target=self._decode_icons, daemon=True).start()
+
+    def _decode_icons(self):
+        decoded = []
+        for name, path in self.available_icons.items():
+            icon_code, _, size_tag = name.removesuffix(".png").partition("_t")
+            if size_tag in ("@2x", "@4x"):
+                try:
+                    decoded.append(((icon_code, size_tag), self.decode_icon(path)))
+                except Exception as e:
+                    logging.error(f"Icon preload error ({name}): {e}")
+        self.after(0, self._register_icons, decoded)
+
+    def _register_icons(self, decoded):
+        for cache_key, img in decoded:
+            if cache_key not in self.icon_cache:
+                self.icon_cache[cache_key] = ImageTk.PhotoImage(img)
+        logging.debug(f"Preloaded {len(decoded)} icons.")
+
+    @staticmethod
+    def decode_icon(path):
+        img = Image.open(path, formats=("PNG",))
+        # The bundled icons are already RGBA; only convert ones that aren't
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
+        img.load()
+        return img
+
+    def get_weather_icon(self, icon_code, size_tag):
+        cache_key = (icon_code, size_tag)
+        if cache_key not in self.icon_cache:
+            ic_path = self.available_icons.get(f"{icon_code}_t{size_tag}.png")
+            # Missing icons are cached as None so they aren't looked up again
+            self.icon_cache[cache_key] = ImageTk.PhotoImage(self.decode_icon(ic_path)) if ic_path else None
+        return self.icon_cache[cache_key]
+
+    def get_http(self):
+        # One keep-alive session for OpenWeather and Zippopotam so polls reuse the TLS connection
+        with self._http_lock:
+            if self.http is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                self.http = requests.Session()
+                self.http.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+                # Only the background polls retry; the geocode runs on the Tk thread and must fail fast
+                self.http.mount("https://api.openweathermap.org/",
+                                HTTPAdapter(pool_connections=1, pool_maxsize=1,
+                                            max_retries=Retry(total=2, backoff_factor=0.5)))
+                self.http.headers["User-Agent"] = "PiWeather/1.0"
+            return self.http
 
     def update_weather(self):
         logging.info("Triggering weather update cycle.")
+        # Manual syncs from the setup dialog replace the pending timer instead of starting a second cycle
+        if self._update_job is not None:
+            self.after_cancel(self._update_job)
+            self._update_job = None
         if not self.api_key: return
 
+        if self._fetch_inflight:
+            # The running fetch may use an old location or key; fetch again as soon as it returns
+            logging.debug("Weather fetch already in progress, queueing another.")
+            self._refetch_pending = True
+        else:
+            self._fetch_inflight = True
+            # Only current, daily and alerts are displayed; skip the large minutely/hourly arrays
+            url = ("https://api.openweathermap.org/data/3.0/onecall"
+                   f"?lat={self.lat}&lon={self.lon}&appid={self.api_key}"
+                   "&units=imperial&exclude=minutely,hourly")
+            # Network I/O runs off the Tk thread so the UI and alert scroller keep running during the fetch
+            threading.Thread(target=self._fetch_weather, args=(url,), daemon=True).start()
+        self._update_job = self.after(600000, self.update_weather)
+
+    def _fetch_weather(self, url):
+        # Every exit must schedule _render_weather or _fetch_failed, or _fetch_inflight never clears
+        try:
+            response = self.get_http().get(url, timeout=HTTP_TIMEOUT)
+            res = json_loads(response.content)
+            # Error payloads ({"cod": 401, "message": ...}) never reach the render path
+            if response.status_code != 200 or not isinstance(res, dict) or "current" not in res:
+                logging.error(f"Weather API error {response.status_code}: {response.text[:200]}")
+                self.after(0, self._fetch_failed)
+                return
+            # Keep only what the dashboard shows (today + 5 days) so the full payload is freed on this thread
+            res = {key: res[key] for key in ("timezone", "current", "daily", "alerts") if key in res}
+            if "daily" in res:
+                res["daily"] = res["daily"][:6]
+        except Exception as e:
+            logging.error(f"Weather fetch fail: {e}")
+            self.after(0, self._fetch_failed)
+            return
+        # Tk is not thread-safe; hand the parsed response back to the main loop for rendering
+        self.after(0, self._render_weather, res)
+
+    def _fetch_done(self):
+        # Returns False when a newer update was requested mid-fetch; that update starts now instead
+        self._fetch_inflight = False
+        if self._refetch_pending:
+            self._refetch_pending = False
+            logging.debug("Discarding stale weather fetch.")
+            self.update_weather()
+            return False
+        return True
+
+    def _fetch_failed(self):
+        if not self._fetch_done():
+            return
+        # Retry sooner than the regular cycle, backing off while the network stays down
+        self._retry_delay = min(self._retry_delay * 2, 600000) if self._retry_delay else 30000
+        if self._update_job is not None:
+            self.after_cancel(self._update_job)
+        self._update_job = self.after(self._retry_delay, self.update_weather)
+
+    def _render_weather(self, res):
+        if not self._fetch_done():
+            return
+        self._retry_delay = 0
         try:
-            url = f"https://api.openweathermap.org/data/3.0/onecall?lat={self.lat}&lon={self.lon}&appid={self.api_key}&units=imperial"
-            res = requests.get(url, timeout=10).json()
-
             if "current" in res:
                 curr = res["current"]
                 icon_code = curr['weather'][0]['icon']
 
-                # 1. Background Composite
-                bg_file = os.path.join(application_path, "images", f"{icon_code}_bg.png")
-                if not os.path.exists(bg_file): bg_file = os.path.join(application_path, "images", "01d_bg.png")
-
-                canvas = Image.open(bg_file).convert("RGBA").resize((800, 480), Image.Resampling.LANCZOS)
-                overlay = Image.new("RGBA", (800, 480), (0, 0, 0, 0))
-                draw_ov = ImageDraw.Draw(overlay)
-                glass_color = (0, 0, 0, 60)
-
-                draw_ov.rectangle([10, 45, 485, 290], fill=glass_color, outline=(255, 255, 255, 30), width=1)
-                draw_ov.rectangle([520, 45, 790, 275], fill=glass_color, outline=(255, 255, 255, 30), width=1)
-                for i in range(5):
-                    x_box = 10 + (i * 158)
-                    draw_ov.rectangle([x_box, 305, x_box + 152, 442], fill=glass_color, outline=(255, 255, 255, 40),
-                                      width=1)
-                    # Darker sub-box for the detailed text area
-                    draw_ov.rectangle([x_box + 3, 355, x_box + 149, 435], fill=(0, 0, 0, 175),
-                                      outline=(255, 255, 255, 20), width=1)
-
-                canvas = Image.alpha_composite(canvas, overlay)
-
-                # 2. Text Rendering
-                draw = ImageDraw.Draw(canvas)
-                try:
-                    f_city = ImageFont.truetype("arial.ttf", 32)
-                    f_temp = ImageFont.truetype("arialbd.ttf", 100)
-                    f_desc = ImageFont.truetype("arial.ttf", 18)
-                    f_det = ImageFont.truetype("arialbd.ttf", 18)
-                    f_day = ImageFont.truetype("arialbd.ttf", 12)
-                    f_f_t = ImageFont.truetype("arialbd.ttf", 14)
-                    f_f_mm = ImageFont.truetype("arial.ttf", 10)
-                    f_hum = ImageFont.truetype("arial.ttf", 10)
-                except Exception as fe:
-                    logging.error(f"Font error: {fe}")
-                    f_city = f_temp = f_desc = f_det = f_day = f_f_t = f_f_mm = f_hum = ImageFont.load_default()
-
-                # Current
-                display_city = get_setting("city_name")
-                display_state = get_setting("state_abbr")
-
-                if display_city and display_state:
-                    location_text = f"{display_city}, {display_state}"
+                if self.city and self.state_abbr:
+                    location_text = f"{self.city}, {self.state_abbr}"
                 else:
                     location_text = res.get("timezone", "Local").split('/')[-1].replace('_', ' ')
 
-                draw.text((30, 60), location_text, font=f_city, fill="#FFFFFF")
-                draw.text((25, 95), f"{int(curr['temp'])}°", font=f_temp, fill="#FFFFFF")
-                draw.text((30, 215), curr['weather'][0]['description'].capitalize(), font=f_desc, fill="#FFFFFF")
-                draw.text((30, 240), datetime.now().strftime("%m/%d"), font=f_det, fill="#FFFFFF")
-
-                ic_path = os.path.join(application_path, "images", f"{icon_code}_t@4x.png")
-                if os.path.exists(ic_path):
-                    bi = Image.open(ic_path).convert("RGBA")
-                    canvas.alpha_composite(bi, (180, 100))
-
-                # Details (Top Right)
-                det = (f"Feels: {int(curr['feels_like'])}°\n"
-                       f"Humid: {curr['humidity']}%\n"
-                       f"Wind:  {int(curr['wind_speed'])} mph\n"
-                       f"UV:    {curr.get('uvi', 0)}\n"
-                       f"Vis:   {curr.get('visibility', 0) / 1609.34:.1f} mi\n"
-                       f"Sunrise: {datetime.fromtimestamp(curr['sunrise']).strftime('%H:%M')}\n"
-                       f"Sunset:  {datetime.fromtimestamp(curr['sunset']).strftime('%H:%M')}\n"
-                       f"Dew Point: {int(curr['dew_point'])}°\n"
+                now = datetime.now()
+                current = (location_text,
+                           f"{int(curr['temp'])}°",
+                           curr['weather'][0]['description'].capitalize(),
+                           now.strftime("%m/%d"))
+
+                det = (f"Feels: {int(curr['feels_like'])}°",
+                       f"Humid: {curr['humidity']}%",
+                       f"Wind:  {int(curr['wind_speed'])} mph",
+                       f"UV:    {curr.get('uvi', 0)}",
+                       f"Vis:   {curr.get('visibility', 0) / 1609.34:.1f} mi",
+                       f"Sunrise: {datetime.fromtimestamp(curr['sunrise']).strftime('%H:%M')}",
+                       f"Sunset:  {datetime.fromtimestamp(curr['sunset']).strftime('%H:%M')}",
+                       f"Dew Point: {int(curr['dew_point'])}°",
                        )
-                draw.multiline_text((545, 65), det, font=f_det, fill="white", spacing=8)
 
-                # Forecast
-                self.forecast_details = []
-                for i, d_data in enumerate(res.get("daily", [])[1:6]):
-                    x = 25 + (i * 158)
+                forecast = []
+                for d_data in res.get("daily", [])[1:6]:
                     w = d_data['weather'][0]
                     t, fl = d_data['temp'], d_data['feels_like']
-
-                    self.forecast_details.append(
+                    forecast.append((
                         f"{w['description'].capitalize()}\n"
                         f"Day: {int(t['day'])}° (Feels: {int(fl['day'])}°)\n"
                         f"Night: {int(t['night'])}°\n"
-                        f"Clouds: {d_data.get('clouds', 0)}%"
-                    )
-
-                    day_str = datetime.fromtimestamp(d_data['dt']).strftime("%a").upper()
-                    date_str = datetime.fromtimestamp(d_data['dt']).strftime("%m/%d")
-                    draw.text((x + 5, 312), f"{day_str} {date_str}", font=f_day, fill="#FFFFFF")
-
-                    fi_path = os.path.join(application_path, "images", f"{w['icon']}_t@2x.png")
-                    if os.path.exists(fi_path):
-                        fi = Image.open(fi_path).convert("RGBA")
-                        canvas.alpha_composite(fi, (x + 45, 280))
-
-                    draw.text((x + 5, 360), f"{int(t['day'])}°/{int(fl['day'])}°", font=f_f_t, fill="#FFFFFF")
-                    draw.text((x + 5, 375), f"L:{int(t['min'])} H:{int(t['max'])}", font=f_f_mm, fill="#FFFFFF")
-                    draw.text((x + 5, 390), f"H:{d_data['humidity']}%", font=f_hum, fill="#48ff00")
-                    draw.text((x + 5, 405), f"Sunrise: {datetime.fromtimestamp(d_data['sunrise']).strftime('%H:%M')}",
-                              font=f_f_mm, fill="#FFFFFF")
-                    draw.text((x + 5, 420), f"Sunset:  {datetime.fromtimestamp(d_data['sunset']).strftime('%H:%M')}",
-                              font=f_f_mm, fill="#FFFFFF")
-
-                # --- MOVE REFRESH LOGIC OUT OF THE FOR LOOP ---
-                photo = ImageTk.PhotoImage(canvas)
-                self.bg_label.config(image=photo)
-                self.bg_image_ref = photo
-                logging.info("Render complete.")
-
-                # 3. Handle Alerts in Scroller
+                        f"Clouds: {d_data.get('clouds', 0)}%",
+                        w['icon'],
+                        {
+                            "day": format_day(d_data['dt']),
+                            "temp": f"{int(t['day'])}°/{int(fl['day'])}°",
+                            "min_max": f"L:{int(t['min'])} H:{int(t['max'])}",
+                            "hum": f"H:{d_data['humidity']}%",
+                            "sunrise": f"Sunrise: {datetime.fromtimestamp(d_data['sunrise']).strftime('%H:%M')}",
+                            "sunset": f"Sunset:  {datetime.fromtimestamp(d_data['sunset']).strftime('%H:%M')}",
+                        },
+                    ))
+
+                # Consecutive polls usually round to the same values; skip all canvas work if nothing visible changed
+                view = (icon_code, current, det, forecast)
+                if view != self._last_view:
+                    self.apply_view(icon_code, current, det, forecast)
+                    self._last_view = view
+                    logging.info("Render complete.")
+                else:
+                    logging.debug("Weather unchanged, skipping render.")
+
+                # Alerts in Scroller (always refreshed so the sync time stays current)
                 alert_msgs = []
                 if "alerts" in res:
                     for alert in res["alerts"]:
@@ -263,94 +504,210 @@ class WeatherApp(tk.Tk):
                 if alert_msgs:
                     full_alert_text = "     ".join(alert_msgs)
                 else:
-                    full_alert_text = f"Last Sync: {datetime.now().strftime('%H:%M')}"
+                    full_alert_text = f"Last Sync: {now.strftime('%H:%M')}"
 
-                self.alert_canvas.itemconfig(self.alert_text, text=full_alert_text, fill="white")
+                self.set_alert_text(full_alert_text, scroll=bool(alert_msgs))
 
         except Exception as e:
             logging.error(f"Weather update fail: {e}")
-        self.after(600000, self.update_weather)
+
+    def apply_view(self, icon_code, current, det, forecast):
+        c = self.main_canvas
+
+        # 1. Background (only re-uploaded when the conditions change)
+        if icon_code != self._last_icon:
+            background = self.get_background(icon_code)
+            if self.bg_photo is None:
+                self.bg_photo = ImageTk.PhotoImage(background)
+                c.itemconfig(self.bg_item, image=self.bg_photo)
+            else:
+                # Update the existing Tk image in place rather than allocating and swapping a new one
+                self.bg_photo.paste(background)
+            self._last_icon = icon_code
+
+        # 2. Current
+        for item, text in zip((self.city_item, self.temp_item, self.desc_item, self.date_item), current):
+            self.set_item(item, text=text)
+        self.set_item(self.icon_item, image=self.get_weather_icon(icon_code, "@4x") or "")
+
+        # Details (Top Right)
+        for item, line in zip(self.detail_items, det):
+            self.set_item(item, text=line)
+
+        # Forecast
+        self.forecast_details = [details for details, _, _ in forecast]
+        self._last_tooltip_idx = None
+        self.tooltip.place_forget()
+        for i, items in enumerate(self.forecast_items):
+            if i >= len(forecast):
+                self.set_item(f"forecast{i}", state="hidden")
+                continue
+            self.set_item(f"forecast{i}", state="normal")
+
+            # Forecast days rarely change between polls; skip boxes identical to the last render
+            if forecast[i] == self._last_forecast[i]:
+                continue
+            _, f_icon, texts = forecast[i]
+            self.set_item(items["icon"], image=self.get_weather_icon(f_icon, "@2x") or "")
+            for key, text in texts.items():
+                self.set_item(items[key], text=text)
+            # Only mark the box rendered once it fully updated, so a failed render is retried next poll
+            self._last_forecast[i] = forecast[i]
+
+    def set_item(self, item, **options):
+        # Only send Tk the options that differ from what the item (or tag) already shows
+        last = self._item_options.setdefault(item, {})
+        changed = {k: v for k, v in options.items() if last.get(k) != v}
+        if changed:
+            self.main_canvas.itemconfig(item, **changed)
+            last.update(changed)
+
+    def set_alert_text(self, text, scroll=False):
+        if text == self.alert_value:
+            return
+        self.alert_value = text
+        self.alert_canvas.itemconfig(self.alert_text, text=text, fill="white")
+        # Measure once per text change so the scroller doesn't query the bbox every tick
+        x1, _, x2, _ = self.alert_canvas.bbox(self.alert_text)
+        self.alert_width = x2 - x1
+
+        # Only alerts scroll; the sync status sits still so the ticker doesn't wake the Pi when idle
+        if scroll:
+            if not self._alert_scrolling:
+                self._alert_scrolling = True
+                self.alert_canvas.coords(self.alert_text, 800, 15)
+                self.start_scroller()
+        else:
+            self._alert_scrolling = False
+            self.stop_scroller()
+            self.alert_canvas.coords(self.alert_text, 10, 15)
+
+    def start_scroller(self):
+        if self._scroll_job is None and self._visible:
+            self._scroll_job = self.after(ALERT_TICK_MS, self.scroll_alerts)
+
+    def stop_scroller(self):
+        if self._scroll_job is not None:
+            self.after_cancel(self._scroll_job)
+            self._scroll_job = None
+
+    def on_map_change(self, event):
+        # The root binding also sees child widget events; only track the main window itself
+        if event.widget is not self:
+            return
+        self._visible = event.type == tk.EventType.Map
+        # No timer runs while hidden; the ticker resumes where it stopped once the window is mapped
+        if self._visible and self._alert_scrolling:
+            self.start_scroller()
+        else:
+            self.stop_scroller()
 
     def scroll_alerts(self):
         try:
             coords = self.alert_canvas.coords(self.alert_text)
-            if coords[0] < -1000:
+            if coords[0] < -self.alert_width:
                 self.alert_canvas.coords(self.alert_text, 800, 15)
             else:
-                self.alert_canvas.move(self.alert_text, -2, 0)
+                self.alert_canvas.move(self.alert_text, -ALERT_STEP_PX, 0)
         except:
             pass
-        self.after(35, self.scroll_alerts)
+        self._scroll_job = self.after(ALERT_TICK_MS, self.scroll_alerts)
+
+    def exit_app(self):
+        logging.info("Exiting.")
+        if self.http is not None:
+            self.http.close()
+        sys.exit(0)
 
     def show_setup_dialog(self):
         logging.info("Opening setup.")
-        setup = tk.Toplevel(self)
+        # Widgets are built on first use and the dialog is hidden/shown afterwards
+        if self.setup_dialog is None:
+            self.build_setup_dialog()
+
+        self.setup_key.delete(0, "end")
+        self.setup_key.insert(0, self.api_key or "")
+        # Try to load existing zip, or leave blank
+        self.setup_zip.delete(0, "end")
+        self.setup_zip.insert(0, get_setting("zip_code") or "")
+        self.setup_debug.set(get_setting("debug_enabled") == "True")
+
+        self.setup_dialog.deiconify()
+        self.setup_dialog.lift()
+        self.setup_dialog.grab_set()
+
+    def hide_setup_dialog(self):
+        self.setup_dialog.grab_release()
+        self.setup_dialog.withdraw()
+
+    def build_setup_dialog(self):
+        setup = self.setup_dialog = tk.Toplevel(self)
         setup.geometry("400x320+200+80")
         setup.overrideredirect(True)
         setup.configure(bg="#222", highlightthickness=2, highlightbackground="#4CAF50")
-        setup.grab_set()
         tk.Label(setup, text="API CONFIG", fg="#4CAF50", bg="#222", font=("Arial", 12, "bold")).pack(pady=15)
 
         tk.Label(setup, text="OpenWeather API Key", fg="white", bg="#222", font=("Arial", 9)).pack()
-        e_key = tk.Entry(setup, width=35)
-        e_key.insert(0, self.api_key or "")
-        e_key.pack(pady=5)
+        self.setup_key = tk.Entry(setup, width=35)
+        self.setup_key.pack(pady=5)
 
         tk.Label(setup, text="Zip Code", fg="white", bg="#222", font=("Arial", 9)).pack()
-        e_zip = tk.Entry(setup, width=15, justify='center')
-        # Try to load existing zip, or leave blank
-        current_zip = get_setting("zip_code") or ""
-        e_zip.insert(0, current_zip)
-        e_zip.pack(pady=5)
+        self.setup_zip = tk.Entry(setup, width=15, justify='center')
+        self.setup_zip.pack(pady=5)
 
         # Debug Checkbox
-        debug_var = tk.BooleanVar(value=(get_setting("debug_enabled") == "True"))
-        tk.Checkbutton(setup, text="Enable Debug Logging", variable=debug_var,
+        self.setup_debug = tk.BooleanVar(value=False)
+        tk.Checkbutton(setup, text="Enable Debug Logging", variable=self.setup_debug,
                        fg="white", bg="#222", selectcolor="#333",
                        activebackground="#222", activeforeground="white").pack(pady=10)
 
-        def save():
-            api_key = e_key.get()
-            zip_code = e_zip.get()
-            debug_enabled = str(debug_var.get())
-
-            try:
-                # Use Zippopotam.us for free zip-to-lat-lon conversion (No API Key required)
-                geo_url = f"https://api.zippopotam.us/us/{zip_code}"
-                response = requests.get(geo_url, timeout=10)
-
-                if response.status_code == 200:
-                    geo_data = response.json()
-                    place = geo_data["places"][0]
-                    new_lat, new_lon = place["latitude"], place["longitude"]
-                    city_name = place["place name"]
-                    state_abbr = place["state abbreviation"]
-
-                    save_setting("api_key", api_key)
-                    save_setting("zip_code", zip_code)
-                    save_setting("lat", new_lat)
-                    save_setting("lon", new_lon)
-                    save_setting("city_name", city_name)
-                    save_setting("state_abbr", state_abbr)
-                    save_setting("debug_enabled", debug_enabled)
-
-                    update_logging_level()
-
-                    self.api_key, self.lat, self.lon = api_key, new_lat, new_lon
-                    setup.destroy()
-                    self.update_weather()
-                else:
-
-                    messagebox.showerror("Error", f"Could not find Zip Code: {zip_code}")
-            except Exception as e:
-                logging.error(f"Geocoding error: {e}")
-                messagebox.showerror("Error", "Failed to connect to geocoding service")
-
         tk.Button(setup, text=" SAVE & SYNC ", bg="#4CAF50", fg="white", font=("Arial", 10, "bold"), width=15,
-                  command=save).pack(pady=15)
+                  command=self.save_setup).pack(pady=15)
         tk.Button(setup, text=" CANCEL ", bg="#444", fg="white", width=15,
-                  command=setup.destroy).pack(pady=5)
-        tk.Button(setup, text=" EXIT APP ", bg="#333", fg="red", command=lambda: sys.exit(0)).pack()
+                  command=self.hide_setup_dialog).pack(pady=5)
+        tk.Button(setup, text=" EXIT APP ", bg="#333", fg="red", command=self.exit_app).pack()
+
+    def save_setup(self):
+        from tkinter import messagebox
+
+        api_key = self.setup_key.get()
+        zip_code = self.setup_zip.get()
+        debug_enabled = str(self.setup_debug.get())
+
+        try:
+            # Use Zippopotam.us for free zip-to-lat-lon conversion (No API Key required)
+            geo_url = f"https://api.zippopotam.us/us/{zip_code}"
+            response = self.get_http().get(geo_url, timeout=HTTP_TIMEOUT)
+
+            if response.status_code == 200:
+                geo_data = response.json()
+                place = geo_data["places"][0]
+                new_lat, new_lon = place["latitude"], place["longitude"]
+                city_name = place["place name"]
+                state_abbr = place["state abbreviation"]
+
+                save_settings({
+                    "api_key": api_key,
+                    "zip_code": zip_code,
+                    "lat": new_lat,
+                    "lon": new_lon,
+                    "city_name": city_name,
+                    "state_abbr": state_abbr,
+                    "debug_enabled": debug_enabled,
+                })
+
+                update_logging_level()
+
+                self.api_key, self.lat, self.lon = api_key, new_lat, new_lon
+                self.city, self.state_abbr = city_name, state_abbr
+                self.hide_setup_dialog()
+                self.update_weather()
+            else:
+
+                messagebox.showerror("Error", f"Could not find Zip Code: {zip_code}")
+        except Exception as e:
+            logging.error(f"Geocoding error: {e}")
+            messagebox.showerror("Error", "Failed to connect to geocoding service")
 
 
 if __name__ == "__main__":